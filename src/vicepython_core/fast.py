@@ -0,0 +1,57 @@
+"""Tagged-tuple Result representation for allocation-sensitive inner loops.
+
+The canonical Ok/Err wrappers allocate a full Python object per value. For
+micro-allocation-sensitive code - tight loops producing millions of results -
+this module offers an opt-in alternative encoding: a plain two-tuple whose
+first element is a tag (0 for ok, 1 for err). Small tuples come from CPython's
+tuple freelist, making construction cheaper than any class instantiation, and
+the representation is transparent to C-level tools like map() and sorted().
+
+This is an escape hatch, not a replacement. Domain code should use the
+canonical Result from vicepython_core.types; convert at the edges of the hot
+loop with from_result/to_result.
+"""
+
+from typing import Final, Literal
+
+from vicepython_core.types import Err, Ok, Result
+
+OK_TAG: Final[Literal[0]] = 0
+ERR_TAG: Final[Literal[1]] = 1
+
+type FastResult[T, E] = tuple[Literal[0], T] | tuple[Literal[1], E]
+"""Tagged-tuple form of Result: (0, value) for ok, (1, error) for err."""
+
+
+def ok[T](value: T) -> tuple[Literal[0], T]:
+    """Build the tagged-tuple ok variant."""
+    return (OK_TAG, value)
+
+
+def err[E](error: E) -> tuple[Literal[1], E]:
+    """Build the tagged-tuple err variant."""
+    return (ERR_TAG, error)
+
+
+def is_ok[T, E](result: FastResult[T, E]) -> bool:
+    """Return True if the tagged tuple is the ok variant."""
+    return result[0] == OK_TAG
+
+
+def is_err[T, E](result: FastResult[T, E]) -> bool:
+    """Return True if the tagged tuple is the err variant."""
+    return result[0] == ERR_TAG
+
+
+def from_result[T, E](result: Result[T, E]) -> FastResult[T, E]:
+    """Convert a canonical Result to its tagged-tuple form."""
+    if isinstance(result, Ok):
+        return (OK_TAG, result.value)
+    return (ERR_TAG, result.error)
+
+
+def to_result[T, E](result: FastResult[T, E]) -> Result[T, E]:
+    """Convert a tagged tuple back to a canonical Result."""
+    if result[0] == OK_TAG:
+        return Ok(result[1])
+    return Err(result[1])
@@ -0,0 +1,57 @@
+"""Pre-fused Result helper chains for hot pipelines.
+
+A chain like `map_ok(and_then(map_ok(x, f), g), h)` pays a Python call frame
+per helper even though each body is a couple of attribute reads. The functions
+here fuse the two most common two-step chains into a single frame, cutting the
+per-element frame-setup overhead without changing semantics. Use them only
+where a profile shows helper dispatch itself is the cost; the single-step
+helpers in result.py remain the default style.
+"""
+
+from collections.abc import Callable
+
+from vicepython_core.types import Ok, Result
+
+
+def map_ok_then[T, U, V, E](
+    result: Result[T, E], f: Callable[[T], U], g: Callable[[U], V]
+) -> Result[V, E]:
+    """Apply two functions to the Ok value in one call.
+
+    Equivalent to `map_ok(map_ok(result, f), g)` with a single frame and a
+    single wrapper allocation.
+
+    Args:
+        result: The Result to map over
+        f: First function to apply to the Ok value
+        g: Second function, applied to f's output
+
+    Returns:
+        Result[V, E]: Ok with g(f(value)), or original Err
+    """
+    if isinstance(result, Ok):
+        return Ok(g(f(result.value)))
+    return result
+
+
+def and_then_map[T, U, V, E](
+    result: Result[T, E], f: Callable[[T], Result[U, E]], g: Callable[[U], V]
+) -> Result[V, E]:
+    """Chain a Result-returning function, then map its Ok value, in one call.
+
+    Equivalent to `map_ok(and_then(result, f), g)` with a single frame.
+
+    Args:
+        result: The Result to chain from
+        f: Function that returns a new Result
+        g: Function applied to the value of f's Ok output
+
+    Returns:
+        Result[V, E]: Ok with g applied, or the first Err encountered
+    """
+    if isinstance(result, Ok):
+        chained = f(result.value)
+        if isinstance(chained, Ok):
+            return Ok(g(chained.value))
+        return chained
+    return result
@@ -1,14 +1,67 @@
 """Helper functions for working with Option types.
 
-All functions use structural pattern matching and are pure (no side effects).
+All functions are pure (no side effects). Variant discrimination uses a plain
+`isinstance(x, Some)` check rather than `match`: these helpers sit on hot
+paths, and the variants are sealed (see types.py) with no virtual subclasses,
+so isinstance is an exact-class test that CPython answers from the type cache
+while avoiding the per-call `__match_args__` lookup and set allocation of the
+MATCH_CLASS opcode. isinstance is also the form mypy narrows in both branches,
+keeping `mypy --strict` clean without casts. Pattern matching remains the
+recommended style for user code.
+
 Import these explicitly: `from vicepython_core.option import map_some, and_then,
 option_from_optional, require_some`
 """
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from typing import cast
 
+from vicepython_core.result import identity
 from vicepython_core.types import Err, Nothing, Ok, Option, Result, Some
 
+NOTHING: Nothing = Nothing()
+"""Shared Nothing instance.
+
+Nothing carries no state, so one instance serves every absence. Helpers in
+this module return NOTHING instead of allocating a fresh Nothing(); callbacks
+passed to and_then can do the same. Nothing() remains constructible, and all
+instances compare equal, so code constructing its own is still correct.
+"""
+
+
+_SOME_SMALL_INTS: dict[int, Some[int]] = {i: Some(i) for i in range(-5, 257)}
+_SOME_TRUE: Some[bool] = Some(True)
+_SOME_FALSE: Some[bool] = Some(False)
+_SOME_NONE: Some[None] = Some(None)
+
+
+def some[T](value: T) -> Some[T]:
+    """Construct Some, reusing interned wrappers for common payloads.
+
+    Mirrors CPython's small-int interning: Some(i) for i in range(-5, 257)
+    plus Some(True), Some(False), and Some(None) are preallocated at import,
+    so wrapping these values in a tight loop allocates nothing. Other payloads
+    construct a fresh Some. Note some(None) is Some(None), a present None -
+    not NOTHING. Interned and fresh wrappers compare equal, so callers that do
+    not want the per-call branch can keep calling Some(value) directly.
+
+    Args:
+        value: Value to wrap
+
+    Returns:
+        Some[T]: A Some containing the value, possibly a shared instance
+    """
+    if type(value) is int:
+        if -5 <= value < 257:
+            return cast("Some[T]", _SOME_SMALL_INTS[value])
+    elif value is True:
+        return cast("Some[T]", _SOME_TRUE)
+    elif value is False:
+        return cast("Some[T]", _SOME_FALSE)
+    elif value is None:
+        return cast("Some[T]", _SOME_NONE)
+    return Some(value)
+
 
 def map_some[T, U](opt: Option[T], f: Callable[[T], U]) -> Option[U]:
     """Apply a function to the value inside Some, leaving Nothing unchanged.
@@ -20,11 +73,12 @@ def map_some[T, U](opt: Option[T], f: Callable[[T], U]) -> Option[U]:
     Returns:
         Option[U]: Some with transformed value, or Nothing
     """
-    match opt:
-        case Some(value):
-            return Some(f(value))
-        case Nothing():
-            return opt
+    if f is identity:
+        # T == U when f is the identity, so the input can be returned as-is.
+        return cast("Option[U]", opt)
+    if isinstance(opt, Some):
+        return Some(f(opt.value))
+    return opt
 
 
 def and_then[T, U](opt: Option[T], f: Callable[[T], Option[U]]) -> Option[U]:
@@ -39,11 +93,9 @@ def and_then[T, U](opt: Option[T], f: Callable[[T], Option[U]]) -> Option[U]:
     Returns:
         Option[U]: Option from applying f, or Nothing
     """
-    match opt:
-        case Some(value):
-            return f(value)
-        case Nothing():
-            return opt
+    if isinstance(opt, Some):
+        return f(opt.value)
+    return opt
 
 
 def option_from_optional[T](value: T | None) -> Option[T]:
@@ -65,10 +117,69 @@ def option_from_optional[T](value: T | None) -> Option[T]:
         Nothing()
     """
     if value is None:
-        return Nothing()
+        return NOTHING
     return Some(value)
 
 
+def options_from_optionals[T](values: Iterable[T | None]) -> list[Option[T]]:
+    """Convert a batch of Optional values to a list of Options.
+
+    Batch counterpart of option_from_optional: one call converts the whole
+    iterable in a single list comprehension instead of paying a Python call
+    per element, and every None maps to the shared NOTHING.
+
+    Args:
+        values: Iterable of optional values to convert
+
+    Returns:
+        list[Option[T]]: Some(value) for each non-None input, NOTHING otherwise
+
+    Example:
+        >>> options_from_optionals([1, None, 3])
+        [Some(1), Nothing(), Some(3)]
+    """
+    return [NOTHING if v is None else Some(v) for v in values]
+
+
+_SOME_CACHE: dict[object, Some[object]] = {}
+_SOME_CACHE_MAX = 1024
+
+
+def option_from_optional_cached[T](value: T | None) -> Option[T]:
+    """Convert Optional to Option, memoizing the Some wrapper per value.
+
+    Opt-in variant of option_from_optional for boundaries that see a small set
+    of recurring hashable values (enums, sentinel ints, short strings): repeat
+    inputs reuse the cached Some instead of allocating a new one. Because Some
+    is frozen, sharing instances is safe. The memo is a hand-rolled dict
+    rather than functools.lru_cache, whose wrapper type is not expressible
+    without Any under this package's mypy configuration.
+
+    Only use where inputs are hashable - unhashable values raise TypeError -
+    and where retaining up to 1024 distinct values is acceptable; once the
+    cache is full, new values are wrapped fresh without eviction. Lookups key
+    on equality and hash like any dict, so values that compare equal across
+    types share a slot: after option_from_optional_cached(1), a call with 1.0
+    or True returns the cached Some(1), whose payload is an equal object of a
+    different type than the input. The general-purpose option_from_optional
+    remains uncached.
+
+    Args:
+        value: Optional value to convert; must be hashable
+
+    Returns:
+        Option[T]: Some(value) if non-None, the shared NOTHING otherwise
+    """
+    if value is None:
+        return NOTHING
+    cached = _SOME_CACHE.get(value)
+    if cached is None:
+        cached = Some(value)
+        if len(_SOME_CACHE) < _SOME_CACHE_MAX:
+            _SOME_CACHE[value] = cached
+    return cast("Some[T]", cached)
+
+
 def require_some[T, E](opt: Option[T], err: E) -> Result[T, E]:
     """Convert Option to Result, providing an error for the Nothing case.
 
@@ -85,8 +196,6 @@ def require_some[T, E](opt: Option[T], err: E) -> Result[T, E]:
         >>> require_some(Nothing(), "missing value")
         Err("missing value")
     """
-    match opt:
-        case Some(value):
-            return Ok(value)
-        case Nothing():
-            return Err(err)
+    if isinstance(opt, Some):
+        return Ok(opt.value)
+    return Err(err)
@@ -1,14 +1,77 @@
 """Helper functions for working with Result types.
 
-All functions use structural pattern matching and are pure (no side effects).
+All functions are pure (no side effects). Variant discrimination uses a plain
+`isinstance(x, Ok)` check rather than `match`: these helpers sit on hot paths,
+and the variants are sealed (see types.py) with no virtual subclasses, so
+isinstance is an exact-class test that CPython answers from the type cache
+while avoiding the per-call `__match_args__` lookup and set allocation of the
+MATCH_CLASS opcode. isinstance is also the form mypy narrows in both branches,
+keeping `mypy --strict` clean without casts. Pattern matching remains the
+recommended style for user code.
+
 Import these explicitly:
     `from vicepython_core.result import map_ok, and_then, collect, map_err, discard_ok_value`
 """
 
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterable, Sequence
+from operator import attrgetter
+from typing import cast
 
 from vicepython_core.types import Err, Ok, Result
 
+_get_value = attrgetter("value")
+
+_OK_NONE: Ok[None] = Ok(None)
+"""Shared Ok(None) instance.
+
+Ok is frozen and None is a singleton, so every valueless success can be the
+same object; helpers that signal bare success return this instead of
+allocating a fresh Ok(None) per call.
+"""
+
+
+_OK_SMALL_INTS: dict[int, Ok[int]] = {i: Ok(i) for i in range(-5, 257)}
+_OK_TRUE: Ok[bool] = Ok(True)
+_OK_FALSE: Ok[bool] = Ok(False)
+
+
+def ok[T](value: T) -> Ok[T]:
+    """Construct Ok, reusing interned wrappers for common payloads.
+
+    Mirrors CPython's small-int interning: Ok(i) for i in range(-5, 257) plus
+    Ok(True), Ok(False), and Ok(None) are preallocated at import, so wrapping
+    these values in a tight loop allocates nothing. Other payloads construct a
+    fresh Ok. Interned and fresh wrappers compare equal, so callers that do
+    not want the per-call branch can keep calling Ok(value) directly.
+
+    Args:
+        value: Value to wrap
+
+    Returns:
+        Ok[T]: An Ok containing the value, possibly a shared instance
+    """
+    if type(value) is int:
+        if -5 <= value < 257:
+            return cast("Ok[T]", _OK_SMALL_INTS[value])
+    elif value is True:
+        return cast("Ok[T]", _OK_TRUE)
+    elif value is False:
+        return cast("Ok[T]", _OK_FALSE)
+    elif value is None:
+        return cast("Ok[T]", _OK_NONE)
+    return Ok(value)
+
+
+def identity[T](x: T) -> T:
+    """Return the argument unchanged.
+
+    Recognized as a sentinel by map_ok and map_some: passing this exact
+    function makes the call a no-op that returns its input without
+    reconstructing the wrapper. Useful when the mapping function is chosen
+    dynamically and the no-transform case is common.
+    """
+    return x
+
 
 def map_ok[T, U, E](result: Result[T, E], f: Callable[[T], U]) -> Result[U, E]:
     """Apply a function to the value inside Ok, leaving Err unchanged.
@@ -20,11 +83,12 @@ def map_ok[T, U, E](result: Result[T, E], f: Callable[[T], U]) -> Result[U, E]:
     Returns:
         Result[U, E]: Ok with transformed value, or original Err
     """
-    match result:
-        case Ok(value):
-            return Ok(f(value))
-        case Err():
-            return result
+    if f is identity:
+        # T == U when f is the identity, so the input can be returned as-is.
+        return cast("Result[U, E]", result)
+    if isinstance(result, Ok):
+        return Ok(f(result.value))
+    return result
 
 
 def and_then[T, U, E](result: Result[T, E], f: Callable[[T], Result[U, E]]) -> Result[U, E]:
@@ -39,21 +103,23 @@ def and_then[T, U, E](result: Result[T, E], f: Callable[[T], Result[U, E]]) -> R
     Returns:
         Result[U, E]: Result from applying f, or original Err
     """
-    match result:
-        case Ok(value):
-            return f(value)
-        case Err():
-            return result
+    if isinstance(result, Ok):
+        return f(result.value)
+    return result
 
 
-def collect[T, E](results: Sequence[Result[T, E]]) -> Result[list[T], E]:
-    """Collect a sequence of Results into a single Result containing a list.
+def collect[T, E](results: Iterable[Result[T, E]]) -> Result[list[T], E]:
+    """Collect an iterable of Results into a single Result containing a list.
 
     Fail-fast: returns the first Err encountered, or Ok with all values.
     Edge case: collect([]) returns Ok([]).
 
+    The input is iterated lazily, exactly once. Generators can be passed
+    directly - `collect(parse(x) for x in stream)` - and on the first Err the
+    unexamined suffix of the stream is never evaluated.
+
     Args:
-        results: Sequence of Results to collect
+        results: Iterable of Results to collect
 
     Returns:
         Result[list[T], E]: Ok with list of all values, or first Err
@@ -67,18 +133,106 @@ def collect[T, E](results: Sequence[Result[T, E]]) -> Result[list[T], E]:
         Ok([])
     """
     collected_values: list[T] = []
+    append = collected_values.append
 
     for result in results:
-        match result:
-            case Ok(value):
-                collected_values.append(value)
-            case Err():
-                return result
+        if isinstance(result, Ok):
+            append(result.value)
+        else:
+            return result
 
     return Ok(collected_values)
 
 
-def map_err[T, E1, E2](result: Result[T, E1], f: Callable[[E1], E2]) -> Result[T, E2]:
+def collect_into[T, E](
+    results: Iterable[Result[T, E]],
+    out: list[T],
+) -> Result[None, E]:
+    """Collect Results into a caller-supplied list instead of a fresh one.
+
+    Semantics match collect, but the values land in `out` (cleared first) and
+    success is signaled with Ok(None). Keeping one buffer alive across calls in
+    a steady-state loop avoids a list allocation per call and lets the list
+    retain its grown capacity. On Err, `out` holds the values seen before the
+    error and should be treated as scratch.
+
+    Args:
+        results: Iterable of Results to collect
+        out: List to receive the Ok values; cleared before use
+
+    Returns:
+        Result[None, E]: Ok(None) with all values in `out`, or first Err
+
+    Example:
+        >>> buf: list[int] = []
+        >>> collect_into([Ok(1), Ok(2)], buf)
+        Ok(None)
+        >>> buf
+        [1, 2]
+    """
+    out.clear()
+    append = out.append
+
+    for result in results:
+        if isinstance(result, Ok):
+            append(result.value)
+        else:
+            return result
+
+    return _OK_NONE
+
+
+def collect_values[T, E](results: Sequence[Result[T, E]]) -> list[T]:
+    """Extract the values from a sequence known to contain only Ok.
+
+    Fast path for callers that have already established (e.g. via prior
+    validation) that every element is Ok: the extraction runs entirely in C
+    via map() and attrgetter, at near-list() speed. This trusts the caller -
+    an Err in the input raises AttributeError rather than being returned.
+    Use collect_values_checked (or collect) when the input may contain Err.
+
+    Args:
+        results: Sequence of Results, all of which must be Ok
+
+    Returns:
+        list[T]: The Ok values, in order
+
+    Example:
+        >>> collect_values([Ok(1), Ok(2), Ok(3)])
+        [1, 2, 3]
+    """
+    return list(map(_get_value, results))
+
+
+def collect_values_checked[T, E](results: Sequence[Result[T, E]]) -> Result[list[T], E]:
+    """Collect a sequence of Results, optimized for the all-Ok case.
+
+    Behaves exactly like collect, but first verifies the all-Ok case with a
+    C-level all() scan and then extracts values with map()/attrgetter. Two
+    C-level passes beat collect's single Python-level loop on large all-Ok
+    sequences; mixed inputs fall back to collect for the first-Err scan.
+
+    Args:
+        results: Sequence of Results to collect
+
+    Returns:
+        Result[list[T], E]: Ok with list of all values, or first Err
+
+    Example:
+        >>> collect_values_checked([Ok(1), Ok(2), Ok(3)])
+        Ok([1, 2, 3])
+        >>> collect_values_checked([Ok(1), Err("bad"), Ok(3)])
+        Err("bad")
+    """
+    if all(isinstance(result, Ok) for result in results):
+        return Ok(list(map(_get_value, results)))
+    return collect(results)
+
+
+def map_err[T, E1, E2](
+    result: Result[T, E1],
+    f: Callable[[E1], E2],
+) -> Result[T, E2]:
     """Apply a function to the error inside Err, leaving Ok unchanged.
 
     Use at boundaries to translate error types between layers.
@@ -96,11 +250,9 @@ def map_err[T, E1, E2](result: Result[T, E1], f: Callable[[E1], E2]) -> Result[T
         >>> mapped = map_err(result, lambda e: str(e))
         >>> # Result[int, str] = Err("bad input")
     """
-    match result:
-        case Ok(value=v):
-            return Ok(v)
-        case Err(error=e):
-            return Err(f(e))
+    if isinstance(result, Ok):
+        return result
+    return Err(f(result.error))
 
 
 def discard_ok_value[T, E](result: Result[T, E]) -> Result[None, E]:
@@ -121,8 +273,6 @@ def discard_ok_value[T, E](result: Result[T, E]) -> Result[None, E]:
         >>> discarded = discard_ok_value(result)
         >>> # Result[None, str] = Ok(None)
     """
-    match result:
-        case Ok():
-            return Ok(None)
-        case Err(error=e):
-            return Err(e)
+    if isinstance(result, Ok):
+        return _OK_NONE
+    return result
@@ -5,48 +5,66 @@ are extremely rare and treated as semver-breaking even in 0.x. The types are
 pure data containers with no behavioral methods (except __repr__/__str__ for
 debugging).
 
+The classes are frozen dataclasses with slots=True: construction is the hot
+path (every map_ok/map_some/collect allocates a wrapper), and the slots layout
+with a single payload field keeps per-instance memory minimal while the
+generated one-field __init__ stays cheap. Keeping them dataclasses (rather
+than hand-rolling __slots__ classes) preserves the inferred covariance of the
+payload parameter - `Ok[int]` remains assignable to `Ok[object]` - which is
+part of the public typing surface of this py.typed package.
+
 Design Invariant: ADT classes remain pure data containers. No behavioral
 methods are permitted. All behavior belongs in free functions in helper modules.
 
-Kind Field Invariant: The 'kind' fields exist solely to support pattern matching
-ergonomics and debugging output. They are not part of the semantic API. Never
-inspect them directly (e.g., if result.kind == "ok"). Always use pattern matching
-to discriminate variants.
+Sealing Invariant: Ok, Err, Some, and Nothing are sealed algebraic variants.
+Do not subclass them; no __init_subclass__ hooks or virtual-subclass
+registrations exist. The helper modules rely on this: with no subclasses or
+virtual registrations, `isinstance(x, Ok)` is an exact-class check, so helpers
+can discriminate variants with a form the type checker narrows instead of
+paying for `match`.
+
+Kind Field Invariant: The 'kind' attributes exist solely to support debugging
+output. They are class-level constants with zero per-instance storage and are
+not part of the semantic API. Never inspect them directly (e.g., if
+result.kind == "ok"). Always use pattern matching to discriminate variants.
 """
 
 from dataclasses import dataclass
-from typing import Literal
+from typing import ClassVar, Literal
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Ok[T]:
     """Success variant of Result, containing a success value."""
 
     value: T
-    kind: Literal["ok"] = "ok"
+
+    kind: ClassVar[Literal["ok"]] = "ok"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Err[E]:
     """Failure variant of Result, containing an error value."""
 
     error: E
-    kind: Literal["err"] = "err"
+
+    kind: ClassVar[Literal["err"]] = "err"
 
 
 type Result[T, E] = Ok[T] | Err[E]
 """Result type representing either success (Ok) or failure (Err)."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Some[T]:
     """Presence variant of Option, containing a value."""
 
     value: T
-    kind: Literal["some"] = "some"
+
+    kind: ClassVar[Literal["some"]] = "some"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Nothing:
     """Absence variant of Option, representing no value.
 
@@ -54,7 +72,7 @@ class Nothing:
     NOTHING = Nothing() constant if desired, but we don't force a singleton.
     """
 
-    kind: Literal["nothing"] = "nothing"
+    kind: ClassVar[Literal["nothing"]] = "nothing"
 
 
 type Option[T] = Some[T] | Nothing
@@ -0,0 +1,29 @@
+"""Shared Result assertion helpers for the test suite.
+
+The same Ok/Err expectation checks appear in dozens of tests; funnelling them
+through three helpers keeps the variant dispatch (a single exact-class
+isinstance check, matching the helper modules) in one place and shrinks the
+test bodies to one line per expectation. conftest.py registers this module
+for pytest's assertion rewriting so failures still show the introspected
+values.
+"""
+
+from vicepython_core import Err, Ok, Result
+
+
+def assert_ok[T](r: Result[T, object], value: T) -> None:
+    """Assert that r is Ok wrapping exactly value."""
+    assert isinstance(r, Ok), f"expected Ok, got {r!r}"
+    assert r.value == value
+
+
+def assert_err_eq(r: Result[object, object], error: object) -> None:
+    """Assert that r is Err with an error equal to error."""
+    assert isinstance(r, Err), f"expected Err, got {r!r}"
+    assert r.error == error
+
+
+def assert_err_contains(r: Result[object, str], substr: str) -> None:
+    """Assert that r is Err with an error containing substr."""
+    assert isinstance(r, Err), f"expected Err, got {r!r}"
+    assert substr in r.error
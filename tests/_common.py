@@ -0,0 +1,43 @@
+"""Shared imports for the test suite.
+
+The test modules draw on the same small set of types and helpers; funnelling
+them through one module means the `from vicepython_core...` import machinery
+runs once during collection instead of per test file. Each test module
+imports only the names it actually uses.
+"""
+
+from vicepython_core import Err, Nothing, Ok, Option, Result, Some
+from vicepython_core.option import option_from_optional, require_some
+from vicepython_core.result import (
+    and_then,
+    collect,
+    collect_into,
+    collect_values,
+    collect_values_checked,
+    discard_ok_value,
+    identity,
+    map_err,
+    map_ok,
+    ok,
+)
+
+__all__ = [
+    "Err",
+    "Nothing",
+    "Ok",
+    "Option",
+    "Result",
+    "Some",
+    "and_then",
+    "collect",
+    "collect_into",
+    "collect_values",
+    "collect_values_checked",
+    "discard_ok_value",
+    "identity",
+    "map_err",
+    "map_ok",
+    "ok",
+    "option_from_optional",
+    "require_some",
+]
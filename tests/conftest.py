@@ -0,0 +1,26 @@
+"""Shared pytest configuration for the test suite.
+
+Registers Hypothesis settings profiles. The properties here check trivially
+true algebraic identities, so the default 100 examples with full
+shrink/explain phases buy nothing: "ci-fast" (the default) runs 25 examples
+with no deadline and drops the shrink and explain phases. Select the full
+defaults with HYPOTHESIS_PROFILE=dev when investigating a failure.
+"""
+
+import os
+
+import pytest
+from hypothesis import Phase, settings
+
+# Rewrite the shared assertion helpers so their failures are introspected
+# like asserts written directly in a test module.
+pytest.register_assert_rewrite("tests._assertions")
+
+settings.register_profile(
+    "ci-fast",
+    max_examples=25,
+    deadline=None,
+    phases=[Phase.explicit, Phase.reuse, Phase.generate],
+)
+settings.register_profile("dev", max_examples=100)
+settings.load_profile(os.environ.get("HYPOTHESIS_PROFILE", "ci-fast"))
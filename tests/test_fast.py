@@ -0,0 +1,45 @@
+"""Tests for the tagged-tuple fast Result representation."""
+
+from vicepython_core import Err, Ok, Result
+from vicepython_core.fast import FastResult, err, from_result, is_err, is_ok, ok, to_result
+
+
+def test_ok_builds_tagged_tuple() -> None:
+    """ok produces a (0, value) tuple."""
+    assert ok(42) == (0, 42)
+
+
+def test_err_builds_tagged_tuple() -> None:
+    """err produces a (1, error) tuple."""
+    assert err("bad") == (1, "bad")
+
+
+def test_is_ok_and_is_err() -> None:
+    """is_ok/is_err discriminate on the tag."""
+    assert is_ok(ok(42))
+    assert not is_ok(err("bad"))
+    assert is_err(err("bad"))
+    assert not is_err(ok(42))
+
+
+def test_from_result_ok() -> None:
+    """from_result converts Ok to the ok tuple."""
+    result: Result[int, str] = Ok(42)
+
+    assert from_result(result) == (0, 42)
+
+
+def test_from_result_err() -> None:
+    """from_result converts Err to the err tuple."""
+    result: Result[int, str] = Err("bad")
+
+    assert from_result(result) == (1, "bad")
+
+
+def test_to_result_round_trip() -> None:
+    """to_result inverts from_result for both variants."""
+    ok_pair: FastResult[int, str] = ok(42)
+    err_pair: FastResult[int, str] = err("bad")
+
+    assert to_result(ok_pair) == Ok(42)
+    assert to_result(err_pair) == Err("bad")
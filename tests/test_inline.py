@@ -0,0 +1,64 @@
+"""Tests for the pre-fused Result helper chains."""
+
+from vicepython_core import Err, Ok, Result
+from vicepython_core.inline import and_then_map, map_ok_then
+
+
+def test_map_ok_then_with_ok() -> None:
+    """map_ok_then applies both functions in order."""
+    result: Result[int, str] = Ok(5)
+    mapped = map_ok_then(result, lambda x: x * 2, lambda x: x + 1)
+
+    match mapped:
+        case Ok(value):
+            assert value == 11
+        case Err():
+            raise AssertionError("Should be Ok")
+
+
+def test_map_ok_then_with_err() -> None:
+    """map_ok_then leaves Err unchanged without calling either function."""
+    result: Result[int, str] = Err("error")
+    mapped = map_ok_then(result, lambda x: x * 2, lambda x: x + 1)
+
+    match mapped:
+        case Ok():
+            raise AssertionError("Should be Err")
+        case Err(error):
+            assert error == "error"
+
+
+def test_and_then_map_with_ok() -> None:
+    """and_then_map chains and then maps the chained Ok value."""
+    result: Result[int, str] = Ok(5)
+    chained = and_then_map(result, lambda x: Ok(x * 2), lambda x: x + 1)
+
+    match chained:
+        case Ok(value):
+            assert value == 11
+        case Err():
+            raise AssertionError("Should be Ok")
+
+
+def test_and_then_map_chain_returns_err() -> None:
+    """and_then_map propagates an Err produced by the chained function."""
+    result: Result[int, str] = Ok(5)
+    chained = and_then_map(result, lambda x: Err("converted"), lambda x: x + 1)
+
+    match chained:
+        case Ok():
+            raise AssertionError("Should be Err")
+        case Err(error):
+            assert error == "converted"
+
+
+def test_and_then_map_with_err() -> None:
+    """and_then_map leaves an input Err unchanged."""
+    result: Result[int, str] = Err("error")
+    chained = and_then_map(result, lambda x: Ok(x * 2), lambda x: x + 1)
+
+    match chained:
+        case Ok():
+            raise AssertionError("Should be Err")
+        case Err(error):
+            assert error == "error"
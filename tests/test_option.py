@@ -7,7 +7,17 @@ from hypothesis import given
 from hypothesis import strategies as st
 
 from vicepython_core import Err, Nothing, Ok, Option, Some
-from vicepython_core.option import and_then, map_some, option_from_optional, require_some
+from vicepython_core.option import (
+    NOTHING,
+    and_then,
+    map_some,
+    option_from_optional,
+    option_from_optional_cached,
+    options_from_optionals,
+    require_some,
+    some,
+)
+from vicepython_core.result import identity
 
 
 # Example tests for map_some
@@ -35,6 +45,14 @@ def test_map_some_with_nothing() -> None:
             assert True
 
 
+def test_map_some_identity_returns_input() -> None:
+    """map_some with identity returns the input Option unchanged."""
+    opt: Option[int] = Some(5)
+    mapped = map_some(opt, identity)
+
+    assert mapped is opt
+
+
 # Example tests for and_then
 def test_and_then_with_some() -> None:
     """and_then chains Some value through function."""
@@ -95,6 +113,85 @@ def test_option_from_optional_with_none() -> None:
             assert True
 
 
+def test_option_from_optional_none_returns_shared_nothing() -> None:
+    """option_from_optional returns the shared NOTHING instance for None."""
+    opt = option_from_optional(None)
+
+    assert opt is NOTHING
+
+
+# Example tests for some
+def test_some_interns_small_ints() -> None:
+    """some returns the shared wrapper for small-integer payloads."""
+    assert some(0) is some(0)
+    assert some(42) is some(42)
+
+
+def test_some_of_none_is_present_none() -> None:
+    """some(None) is a present None, not NOTHING."""
+    assert some(None) == Some(None)
+    assert some(None) != NOTHING
+
+
+def test_some_uninterned_payload_is_fresh_but_equal() -> None:
+    """some constructs a fresh, equal Some for payloads outside the cache."""
+    assert some(10_000) is not some(10_000)
+    assert some(10_000) == Some(10_000)
+
+
+# Example tests for options_from_optionals
+def test_options_from_optionals_mixed() -> None:
+    """options_from_optionals converts each element positionally."""
+    opts = options_from_optionals([1, None, 3])
+
+    assert opts == [Some(1), Nothing(), Some(3)]
+
+
+def test_options_from_optionals_empty() -> None:
+    """options_from_optionals returns [] for empty input."""
+    assert options_from_optionals([]) == []
+
+
+def test_options_from_optionals_shares_nothing() -> None:
+    """Every None in the batch maps to the shared NOTHING instance."""
+    opts = options_from_optionals([None, None])
+
+    assert opts[0] is NOTHING
+    assert opts[1] is NOTHING
+
+
+# Example tests for option_from_optional_cached
+def test_option_from_optional_cached_with_value() -> None:
+    """option_from_optional_cached converts non-None to Some."""
+    opt = option_from_optional_cached(42)
+
+    match opt:
+        case Some(value):
+            assert value == 42
+        case Nothing():
+            raise AssertionError("Should be Some")
+
+
+def test_option_from_optional_cached_reuses_wrapper() -> None:
+    """option_from_optional_cached returns the same Some for repeat inputs."""
+    first = option_from_optional_cached("host")
+    second = option_from_optional_cached("host")
+
+    assert first is second
+
+
+def test_option_from_optional_cached_with_none() -> None:
+    """option_from_optional_cached maps None to the shared NOTHING."""
+    opt = option_from_optional_cached(None)
+
+    assert opt is NOTHING
+
+
+def test_nothing_equals_shared_nothing() -> None:
+    """A freshly constructed Nothing compares equal to the shared NOTHING."""
+    assert Nothing() == NOTHING
+
+
 # Example tests for require_some
 def test_require_some_with_some() -> None:
     """require_some converts Some to Ok."""
@@ -3,11 +3,51 @@
 Example tests and hypothesis property tests focusing on practical invariants.
 """
 
-from hypothesis import given
+from collections.abc import Iterator
+from string import ascii_letters
+
+from hypothesis import example, given
 from hypothesis import strategies as st
 
-from vicepython_core import Err, Ok, Result
-from vicepython_core.result import and_then, collect, discard_ok_value, map_err, map_ok
+from tests._assertions import assert_err_eq, assert_ok
+from tests._common import (
+    Err,
+    Ok,
+    Result,
+    and_then,
+    collect,
+    collect_into,
+    collect_values,
+    collect_values_checked,
+    discard_ok_value,
+    identity,
+    map_err,
+    map_ok,
+    ok,
+)
+
+# Strategies are hoisted to module scope so each @given shares one instance
+# instead of rebuilding the strategy tree per decoration.
+ST_INT = st.integers()
+# The arithmetic properties (map/chain with +1, *2) do not depend on bignum
+# magnitude, so bounding the draws keeps them in the fast machine-int range.
+ST_INT_BOUNDED = st.integers(min_value=-(10**9), max_value=10**9)
+ST_TEXT = st.text()
+# The pass-through error tests only assert identity of the error string, so a
+# small ASCII alphabet generates just as much coverage far more cheaply than
+# unbounded Unicode text.
+ST_ERR_TEXT = st.text(alphabet=ascii_letters, max_size=16)
+# Capped list sizes: the collect properties (order preservation, first-Err)
+# hold element-wise, so 32 elements cover them without paying for the
+# wrapper-per-element cost of hundred-element draws.
+ST_INT_LIST = st.lists(st.integers(), max_size=32)
+ST_INT_LIST_NONEMPTY = st.lists(st.integers(), min_size=1, max_size=32)
+ST_NONNEG = st.integers(min_value=0)
+
+# Shared Err fixtures: the pass-through tests never mutate them (the types are
+# frozen), so one allocation at import serves every test.
+ERR_GENERIC: Result[int, str] = Err("error")
+ERR_BAD: Result[int, str] = Err("bad")
 
 
 # Example tests for map_ok
@@ -16,23 +56,22 @@ def test_map_ok_with_ok() -> None:
     result: Result[int, str] = Ok(5)
     mapped = map_ok(result, lambda x: x * 2)
 
-    match mapped:
-        case Ok(value):
-            assert value == 10
-        case Err():
-            raise AssertionError("Should be Ok")
+    assert_ok(mapped, 10)
 
 
 def test_map_ok_with_err() -> None:
     """map_ok leaves Err unchanged."""
-    result: Result[int, str] = Err("error")
-    mapped = map_ok(result, lambda x: x * 2)
+    mapped = map_ok(ERR_GENERIC, lambda x: x * 2)
 
-    match mapped:
-        case Ok():
-            raise AssertionError("Should be Err")
-        case Err(error):
-            assert error == "error"
+    assert_err_eq(mapped, "error")
+
+
+def test_map_ok_identity_returns_input() -> None:
+    """map_ok with identity returns the input Result unchanged."""
+    result: Result[int, str] = Ok(5)
+    mapped = map_ok(result, identity)
+
+    assert mapped is result
 
 
 # Example tests for and_then
@@ -41,11 +80,7 @@ def test_and_then_with_ok() -> None:
     result: Result[int, str] = Ok(5)
     chained = and_then(result, lambda x: Ok(x * 2))
 
-    match chained:
-        case Ok(value):
-            assert value == 10
-        case Err():
-            raise AssertionError("Should be Ok")
+    assert_ok(chained, 10)
 
 
 def test_and_then_with_ok_returning_err() -> None:
@@ -53,23 +88,14 @@ def test_and_then_with_ok_returning_err() -> None:
     result: Result[int, str] = Ok(5)
     chained = and_then(result, lambda x: Err("converted to error"))
 
-    match chained:
-        case Ok():
-            raise AssertionError("Should be Err")
-        case Err(error):
-            assert error == "converted to error"
+    assert_err_eq(chained, "converted to error")
 
 
 def test_and_then_with_err() -> None:
     """and_then leaves Err unchanged."""
-    result: Result[int, str] = Err("error")
-    chained = and_then(result, lambda x: Ok(x * 2))
+    chained = and_then(ERR_GENERIC, lambda x: Ok(x * 2))
 
-    match chained:
-        case Ok():
-            raise AssertionError("Should be Err")
-        case Err(error):
-            assert error == "error"
+    assert_err_eq(chained, "error")
 
 
 # Example tests for collect
@@ -78,23 +104,15 @@ def test_collect_all_ok() -> None:
     results: list[Result[int, str]] = [Ok(1), Ok(2), Ok(3)]
     collected = collect(results)
 
-    match collected:
-        case Ok(values):
-            assert values == [1, 2, 3]
-        case Err():
-            raise AssertionError("Should be Ok")
+    assert_ok(collected, [1, 2, 3])
 
 
 def test_collect_with_err() -> None:
     """collect returns first Err encountered."""
-    results: list[Result[int, str]] = [Ok(1), Err("bad"), Ok(3)]
+    results: list[Result[int, str]] = [Ok(1), ERR_BAD, Ok(3)]
     collected = collect(results)
 
-    match collected:
-        case Ok():
-            raise AssertionError("Should be Err")
-        case Err(error):
-            assert error == "bad"
+    assert_err_eq(collected, "bad")
 
 
 def test_collect_empty_list() -> None:
@@ -102,11 +120,7 @@ def test_collect_empty_list() -> None:
     results: list[Result[int, str]] = []
     collected = collect(results)
 
-    match collected:
-        case Ok(values):
-            assert values == []
-        case Err():
-            raise AssertionError("Should be Ok")
+    assert_ok(collected, [])
 
 
 def test_collect_first_err() -> None:
@@ -114,11 +128,106 @@ def test_collect_first_err() -> None:
     results: list[Result[int, str]] = [Ok(1), Err("first"), Err("second")]
     collected = collect(results)
 
-    match collected:
-        case Ok():
-            raise AssertionError("Should be Err")
-        case Err(error):
-            assert error == "first"
+    assert_err_eq(collected, "first")
+
+
+def test_collect_generator_short_circuits() -> None:
+    """collect accepts a generator and stops consuming it at the first Err."""
+    consumed: list[int] = []
+
+    def produce() -> Iterator[Result[int, str]]:
+        for i, result in enumerate([Ok(1), Err("bad"), Ok(3)]):
+            consumed.append(i)
+            yield result
+
+    collected = collect(produce())
+
+    assert_err_eq(collected, "bad")
+
+    assert consumed == [0, 1]
+
+
+# Example tests for collect_into
+def test_collect_into_all_ok() -> None:
+    """collect_into fills the supplied buffer and returns Ok(None)."""
+    buf: list[int] = []
+    results: list[Result[int, str]] = [Ok(1), Ok(2), Ok(3)]
+    collected = collect_into(results, buf)
+
+    assert_ok(collected, None)
+
+    assert buf == [1, 2, 3]
+
+
+def test_collect_into_clears_previous_contents() -> None:
+    """collect_into clears the buffer before collecting."""
+    buf = [99, 98]
+    results: list[Result[int, str]] = [Ok(1)]
+    collect_into(results, buf)
+
+    assert buf == [1]
+
+
+def test_collect_into_with_err() -> None:
+    """collect_into returns the first Err encountered."""
+    buf: list[int] = []
+    results: list[Result[int, str]] = [Ok(1), Err("bad"), Ok(3)]
+    collected = collect_into(results, buf)
+
+    assert_err_eq(collected, "bad")
+
+
+# Example tests for collect_values / collect_values_checked
+def test_collect_values_all_ok() -> None:
+    """collect_values extracts values from an all-Ok sequence."""
+    results: list[Result[int, str]] = [Ok(1), Ok(2), Ok(3)]
+
+    assert collect_values(results) == [1, 2, 3]
+
+
+def test_collect_values_empty() -> None:
+    """collect_values returns [] for empty input."""
+    results: list[Result[int, str]] = []
+
+    assert collect_values(results) == []
+
+
+def test_collect_values_checked_all_ok() -> None:
+    """collect_values_checked returns Ok with all values when all are Ok."""
+    results: list[Result[int, str]] = [Ok(1), Ok(2), Ok(3)]
+    collected = collect_values_checked(results)
+
+    assert_ok(collected, [1, 2, 3])
+
+
+def test_collect_values_checked_first_err() -> None:
+    """collect_values_checked returns the first Err, like collect."""
+    results: list[Result[int, str]] = [Ok(1), Err("first"), Err("second")]
+    collected = collect_values_checked(results)
+
+    assert_err_eq(collected, "first")
+
+
+# Example tests for ok
+def test_ok_interns_small_ints() -> None:
+    """ok returns the shared wrapper for small-integer payloads."""
+    assert ok(0) is ok(0)
+    assert ok(-5) is ok(-5)
+    assert ok(256) is ok(256)
+
+
+def test_ok_interns_none_and_bools() -> None:
+    """ok returns shared wrappers for None, True, and False."""
+    assert ok(None) is ok(None)
+    assert ok(True) is ok(True)
+    assert ok(False) is ok(False)
+
+
+def test_ok_uninterned_payload_is_fresh_but_equal() -> None:
+    """ok constructs a fresh, equal Ok for payloads outside the cache."""
+    assert ok(10_000) is not ok(10_000)
+    assert ok(10_000) == Ok(10_000)
+    assert ok("text") == Ok("text")
 
 
 # Example tests for map_err
@@ -127,11 +236,7 @@ def test_map_err_with_ok() -> None:
     result: Result[int, ValueError] = Ok(5)
     mapped = map_err(result, lambda e: str(e))
 
-    match mapped:
-        case Ok(value):
-            assert value == 5
-        case Err():
-            raise AssertionError("Should be Ok")
+    assert_ok(mapped, 5)
 
 
 def test_map_err_with_err() -> None:
@@ -139,11 +244,7 @@ def test_map_err_with_err() -> None:
     result: Result[int, ValueError] = Err(ValueError("bad"))
     mapped = map_err(result, lambda e: f"Error: {e}")
 
-    match mapped:
-        case Ok():
-            raise AssertionError("Should be Err")
-        case Err(error):
-            assert error == "Error: bad"
+    assert_err_eq(mapped, "Error: bad")
 
 
 # Example tests for discard_ok_value
@@ -152,11 +253,15 @@ def test_discard_ok_value_with_ok() -> None:
     result: Result[str, str] = Ok("some output")
     discarded = discard_ok_value(result)
 
-    match discarded:
-        case Ok(value):
-            assert value is None
-        case Err():
-            raise AssertionError("Should be Ok")
+    assert_ok(discarded, None)
+
+
+def test_discard_ok_value_returns_shared_ok_none() -> None:
+    """discard_ok_value returns the same Ok(None) instance for every Ok."""
+    first = discard_ok_value(Ok("one"))
+    second = discard_ok_value(Ok("two"))
+
+    assert first is second
 
 
 def test_discard_ok_value_with_err() -> None:
@@ -164,16 +269,12 @@ def test_discard_ok_value_with_err() -> None:
     result: Result[str, str] = Err("error")
     discarded = discard_ok_value(result)
 
-    match discarded:
-        case Ok():
-            raise AssertionError("Should be Err")
-        case Err(error):
-            assert error == "error"
+    assert_err_eq(discarded, "error")
 
 
 # Hypothesis property tests
-@given(st.integers(), st.text())
-def test_property_map_ok_preserves_err(value: int, error: str) -> None:
+@given(ST_ERR_TEXT)
+def test_property_map_ok_preserves_err(error: str) -> None:
     """map_ok on Err returns the same Err without calling function."""
     result: Result[int, str] = Err(error)
 
@@ -182,28 +283,23 @@ def test_property_map_ok_preserves_err(value: int, error: str) -> None:
 
     mapped = map_ok(result, should_not_be_called)
 
-    match mapped:
-        case Err(err):
-            assert err == error
-        case Ok():
-            raise AssertionError("Should remain Err")
+    assert_err_eq(mapped, error)
 
 
-@given(st.integers())
+@given(ST_INT_BOUNDED)
+@example(0)
+@example(-1)
+@example(2**62)
 def test_property_map_ok_transforms_ok(value: int) -> None:
     """map_ok on Ok applies the function to the value."""
     result: Result[int, str] = Ok(value)
     mapped = map_ok(result, lambda x: x + 1)
 
-    match mapped:
-        case Ok(new_value):
-            assert new_value == value + 1
-        case Err():
-            raise AssertionError("Should remain Ok")
+    assert_ok(mapped, value + 1)
 
 
-@given(st.integers(), st.text())
-def test_property_and_then_preserves_err(value: int, error: str) -> None:
+@given(ST_ERR_TEXT)
+def test_property_and_then_preserves_err(error: str) -> None:
     """and_then on Err returns the same Err without calling function."""
     result: Result[int, str] = Err(error)
 
@@ -212,69 +308,47 @@ def test_property_and_then_preserves_err(value: int, error: str) -> None:
 
     chained = and_then(result, should_not_be_called)
 
-    match chained:
-        case Err(err):
-            assert err == error
-        case Ok():
-            raise AssertionError("Should remain Err")
+    assert_err_eq(chained, error)
 
 
-@given(st.integers())
+@given(ST_INT_BOUNDED)
 def test_property_and_then_chains_ok(value: int) -> None:
     """and_then on Ok applies function and returns its result."""
     result: Result[int, str] = Ok(value)
     chained = and_then(result, lambda x: Ok(x * 2))
 
-    match chained:
-        case Ok(new_value):
-            assert new_value == value * 2
-        case Err():
-            raise AssertionError("Should be Ok")
+    assert_ok(chained, value * 2)
 
 
-@given(st.lists(st.integers()))
+@given(ST_INT_LIST)
+@example([])
+@example([0])
 def test_property_collect_preserves_order(values: list[int]) -> None:
     """collect preserves the order of values."""
     results: list[Result[int, str]] = [Ok(v) for v in values]
     collected = collect(results)
 
-    match collected:
-        case Ok(collected_values):
-            assert collected_values == values
-        case Err():
-            raise AssertionError("Should be Ok")
+    assert_ok(collected, values)
 
 
-@given(st.lists(st.integers(), min_size=1), st.integers(min_value=0))
+@given(ST_INT_LIST_NONEMPTY, ST_NONNEG)
 def test_property_collect_returns_first_err(values: list[int], err_index: int) -> None:
     """collect returns the first Err in the sequence."""
     err_index = err_index % len(values)
-    results: list[Result[int, str]] = [
-        Err(f"error_{i}") if i == err_index else Ok(v) for i, v in enumerate(values)
-    ]
-
-    collected = collect(results)
+    # Build the sequence by slicing around the Err instead of testing the
+    # index on every element.
+    results: list[Result[int, str]] = (
+        [Ok(v) for v in values[:err_index]]
+        + [Err(f"error_{err_index}")]
+        + [Ok(v) for v in values[err_index + 1 :]]
+    )
 
-    match collected:
-        case Err(error):
-            assert error == f"error_{err_index}"
-        case Ok():
-            raise AssertionError("Should be Err")
-
-
-def test_property_collect_empty_is_ok() -> None:
-    """collect([]) returns Ok([])."""
-    results: list[Result[int, str]] = []
     collected = collect(results)
 
-    match collected:
-        case Ok(values):
-            assert values == []
-        case Err():
-            raise AssertionError("Should be Ok")
+    assert_err_eq(collected, f"error_{err_index}")
 
 
-@given(st.integers(), st.text())
+@given(ST_INT, ST_TEXT)
 def test_property_map_err_preserves_ok(value: int, error_msg: str) -> None:
     """map_err on Ok returns the same Ok without calling function."""
     result: Result[int, str] = Ok(value)
@@ -284,47 +358,31 @@ def test_property_map_err_preserves_ok(value: int, error_msg: str) -> None:
 
     mapped = map_err(result, should_not_be_called)
 
-    match mapped:
-        case Ok(v):
-            assert v == value
-        case Err():
-            raise AssertionError("Should remain Ok")
+    assert_ok(mapped, value)
 
 
-@given(st.text())
+@given(ST_TEXT)
 def test_property_map_err_transforms_err(error: str) -> None:
     """map_err on Err applies the function to the error."""
     result: Result[int, str] = Err(error)
     mapped = map_err(result, lambda e: f"transformed: {e}")
 
-    match mapped:
-        case Err(new_error):
-            assert new_error == f"transformed: {error}"
-        case Ok():
-            raise AssertionError("Should remain Err")
+    assert_err_eq(mapped, f"transformed: {error}")
 
 
-@given(st.integers(), st.text())
+@given(ST_INT, ST_TEXT)
 def test_property_discard_ok_value_preserves_err(value: int, error: str) -> None:
     """discard_ok_value on Err returns the same Err."""
     result: Result[int, str] = Err(error)
     discarded = discard_ok_value(result)
 
-    match discarded:
-        case Err(err):
-            assert err == error
-        case Ok():
-            raise AssertionError("Should remain Err")
+    assert_err_eq(discarded, error)
 
 
-@given(st.integers())
+@given(ST_INT)
 def test_property_discard_ok_value_discards_any_ok_value(value: int) -> None:
     """discard_ok_value on Ok returns Ok(None) regardless of input value."""
     result: Result[int, str] = Ok(value)
     discarded = discard_ok_value(result)
 
-    match discarded:
-        case Ok(v):
-            assert v is None
-        case Err():
-            raise AssertionError("Should remain Ok")
+    assert_ok(discarded, None)
@@ -1,226 +1,189 @@
 """Integration smoke tests showing realistic usage patterns.
 
 Tests demonstrate how to combine helpers in chains and realistic scenarios.
+The scenario helpers are pure and stateless, so they live at module level
+rather than being redefined as closures inside every test.
 """
 
-from vicepython_core import Err, Nothing, Ok, Option, Result
-from vicepython_core.option import option_from_optional, require_some
-from vicepython_core.result import and_then, collect, map_ok
+import pytest
 
+from tests._assertions import assert_err_contains, assert_err_eq, assert_ok
+from tests._common import (
+    Err,
+    Nothing,
+    Ok,
+    Option,
+    Result,
+    and_then,
+    collect,
+    map_ok,
+    option_from_optional,
+    require_some,
+)
 
-def test_chaining_result_operations() -> None:
+# Lookup tables for the scenario helpers, built once at import instead of on
+# every call.
+_CONFIG = {"host": "localhost", "port": "8080"}
+_USERS = {"alice": 1, "bob": 2}
+_USER_DATA = {1: {"name": "Alice", "email": "alice@example.com"}, 2: {"name": "Bob"}}
+
+
+def _parse_int(s: str) -> Result[int, str]:
+    # isdecimal pre-check instead of try/except: invalid inputs skip the cost
+    # of raising and catching a ValueError. isdecimal (unlike isdigit, which
+    # accepts characters such as "²" that int() rejects) is a strict subset of
+    # what int() parses, so the call below cannot raise. The accepted domain
+    # is narrower than int()'s: no "+5", no surrounding whitespace, no "1_000".
+    digits = s[1:] if s.startswith("-") else s
+    if digits.isdecimal():
+        return Ok(int(s))
+    return Err(f"Invalid integer: {s}")
+
+
+def _validate_positive(n: int) -> Result[int, str]:
+    if n > 0:
+        return Ok(n)
+    return Err(f"Not positive: {n}")
+
+
+def _double(n: int) -> Result[int, str]:
+    return Ok(n * 2)
+
+
+def _lookup_config(key: str) -> Option[str]:
+    return option_from_optional(_CONFIG.get(key))
+
+
+def _get_user_id(username: str | None) -> Option[int]:
+    if username is None:
+        return Nothing()
+    return option_from_optional(_USERS.get(username))
+
+
+def _fetch_user_data(user_id: int) -> Result[dict[str, str], str]:
+    data = _USER_DATA.get(user_id)
+    if data is not None:
+        return Ok(data)
+    return Err(f"User {user_id} not found")
+
+
+def _times_two(x: int) -> int:
+    return x * 2
+
+
+def _plus_ten(x: int) -> int:
+    return x + 10
+
+
+def _get_email(user_data: dict[str, str]) -> Result[str, str]:
+    email = user_data.get("email")
+    if email is not None:
+        return Ok(email)
+    return Err("Email not found in user data")
+
+
+@pytest.mark.parametrize(
+    ("s", "expected"),
+    [
+        ("42", Ok(84)),
+        ("not a number", "Invalid integer"),
+        ("-5", "Not positive"),
+    ],
+)
+def test_chaining_result_operations(s: str, expected: Ok[int] | str) -> None:
     """Multiple Result operations can be chained together."""
+    result = _parse_int(s)
+    result = and_then(result, _validate_positive)
+    result = and_then(result, _double)
 
-    def parse_int(s: str) -> Result[int, str]:
-        try:
-            return Ok(int(s))
-        except ValueError:
-            return Err(f"Invalid integer: {s}")
-
-    def validate_positive(n: int) -> Result[int, str]:
-        if n > 0:
-            return Ok(n)
-        return Err(f"Not positive: {n}")
-
-    def double(n: int) -> Result[int, str]:
-        return Ok(n * 2)
-
-    # Success path
-    result = parse_int("42")
-    result = and_then(result, validate_positive)
-    result = and_then(result, double)
-
-    match result:
-        case Ok(value):
-            assert value == 84
-        case Err():
-            raise AssertionError("Should succeed")
-
-    # Failure path - invalid integer
-    result = parse_int("not a number")
-    result = and_then(result, validate_positive)
-    result = and_then(result, double)
-
-    match result:
-        case Err(error):
-            assert "Invalid integer" in error
-        case Ok():
-            raise AssertionError("Should fail")
-
-    # Failure path - not positive
-    result = parse_int("-5")
-    result = and_then(result, validate_positive)
-    result = and_then(result, double)
-
-    match result:
-        case Err(error):
-            assert "Not positive" in error
-        case Ok():
-            raise AssertionError("Should fail")
-
-
-def test_collecting_multiple_results() -> None:
-    """collect can gather results from multiple operations."""
-
-    def parse_int(s: str) -> Result[int, str]:
-        try:
-            return Ok(int(s))
-        except ValueError:
-            return Err(f"Invalid integer: {s}")
-
-    # All succeed
-    inputs = ["1", "2", "3", "4", "5"]
-    results = [parse_int(s) for s in inputs]
-    collected = collect(results)
+    if isinstance(expected, Ok):
+        assert_ok(result, expected.value)
+    else:
+        assert_err_contains(result, expected)
 
-    match collected:
-        case Ok(values):
-            assert values == [1, 2, 3, 4, 5]
-        case Err():
-            raise AssertionError("Should succeed")
 
-    # One fails
-    inputs = ["1", "2", "bad", "4", "5"]
-    results = [parse_int(s) for s in inputs]
+def test_collecting_all_succeed() -> None:
+    """collect gathers values when every parse succeeds."""
+    inputs = ("1", "2", "3", "4", "5")
+    results = [_parse_int(s) for s in inputs]
     collected = collect(results)
 
-    match collected:
-        case Err(error):
-            assert "bad" in error
-        case Ok():
-            raise AssertionError("Should fail")
+    assert_ok(collected, [1, 2, 3, 4, 5])
 
 
-def test_option_to_result_conversion() -> None:
-    """Options can be converted to Results with custom errors."""
+def test_collecting_one_fails() -> None:
+    """collect surfaces the failing parse as its Err."""
+    inputs = ("1", "2", "bad", "4", "5")
+    results = [_parse_int(s) for s in inputs]
+    collected = collect(results)
+
+    assert_err_contains(collected, "bad")
 
-    def lookup_config(key: str) -> Option[str]:
-        config = {"host": "localhost", "port": "8080"}
-        value = config.get(key)
-        return option_from_optional(value)
 
-    # Present key
-    opt = lookup_config("host")
+def test_option_to_result_present_key() -> None:
+    """require_some converts a present Option into Ok."""
+    opt = _lookup_config("host")
     result = require_some(opt, "Missing config key: host")
 
-    match result:
-        case Ok(value):
-            assert value == "localhost"
-        case Err():
-            raise AssertionError("Should succeed")
+    assert_ok(result, "localhost")
 
-    # Missing key
-    opt = lookup_config("database")
+
+def test_option_to_result_missing_key() -> None:
+    """require_some converts a missing Option into the custom Err."""
+    opt = _lookup_config("database")
     result = require_some(opt, "Missing config key: database")
 
-    match result:
-        case Err(error):
-            assert error == "Missing config key: database"
-        case Ok():
-            raise AssertionError("Should fail")
+    assert_err_eq(result, "Missing config key: database")
 
 
-def test_combining_option_and_result() -> None:
+@pytest.mark.parametrize(
+    ("username", "expected"),
+    [
+        ("alice", Ok("alice@example.com")),
+        (None, "Username not found"),
+        ("bob", "Email not found in user data"),
+    ],
+)
+def test_combining_option_and_result(username: str | None, expected: Ok[str] | str) -> None:
     """Options and Results can be combined in realistic workflows."""
-
-    def get_user_id(username: str | None) -> Option[int]:
-        users = {"alice": 1, "bob": 2}
-        if username is None:
-            return Nothing()
-        user_id = users.get(username)
-        return option_from_optional(user_id)
-
-    def fetch_user_data(user_id: int) -> Result[dict[str, str], str]:
-        data = {1: {"name": "Alice", "email": "alice@example.com"}, 2: {"name": "Bob"}}
-        if user_id in data:
-            return Ok(data[user_id])
-        return Err(f"User {user_id} not found")
-
-    def get_email(user_data: dict[str, str]) -> Result[str, str]:
-        email = user_data.get("email")
-        if email is not None:
-            return Ok(email)
-        return Err("Email not found in user data")
-
-    # Success path
-    user_id_opt = get_user_id("alice")
+    user_id_opt = _get_user_id(username)
     result = require_some(user_id_opt, "Username not found")
-    result = and_then(result, fetch_user_data)
-    result = and_then(result, get_email)
+    result = and_then(result, _fetch_user_data)
+    result = and_then(result, _get_email)
 
-    match result:
-        case Ok(email):
-            assert email == "alice@example.com"
-        case Err():
-            raise AssertionError("Should succeed")
+    if isinstance(expected, Ok):
+        assert_ok(result, expected.value)
+    else:
+        assert_err_eq(result, expected)
 
-    # Failure - no username
-    user_id_opt = get_user_id(None)
-    result = require_some(user_id_opt, "Username not found")
-    result = and_then(result, fetch_user_data)
-    result = and_then(result, get_email)
 
-    match result:
-        case Err(error):
-            assert error == "Username not found"
-        case Ok():
-            raise AssertionError("Should fail")
+def test_map_ok_pipeline_transforms() -> None:
+    """map_ok transforms values through a pipeline."""
+    result = _parse_int("21")
+    result = map_ok(result, _times_two)
+    result = map_ok(result, _plus_ten)
+
+    assert_ok(result, 52)  # (21 * 2) + 10
+
+
+def test_map_ok_pipeline_propagates_err() -> None:
+    """An Err propagates untouched through a map_ok chain."""
+    result = _parse_int("not a number")
+    result = map_ok(result, _times_two)
+    result = map_ok(result, _plus_ten)
+
+    assert_err_contains(result, "Invalid integer")
+
+
+def test_collect_gathers_values() -> None:
+    """collect produces the list of values from an all-Ok sequence."""
+    collected = collect([Ok(1), Ok(2), Ok(3)])
+
+    assert_ok(collected, [1, 2, 3])
 
-    # Failure - user exists but no email
-    user_id_opt = get_user_id("bob")
-    result = require_some(user_id_opt, "Username not found")
-    result = and_then(result, fetch_user_data)
-    result = and_then(result, get_email)
-
-    match result:
-        case Err(error):
-            assert error == "Email not found in user data"
-        case Ok():
-            raise AssertionError("Should fail")
-
-
-def test_map_ok_in_pipeline() -> None:
-    """map_ok can be used to transform values in a pipeline."""
-
-    def parse_int(s: str) -> Result[int, str]:
-        try:
-            return Ok(int(s))
-        except ValueError:
-            return Err(f"Invalid integer: {s}")
-
-    # Transform with map_ok
-    result = parse_int("21")
-    result = map_ok(result, lambda x: x * 2)
-    result = map_ok(result, lambda x: x + 10)
-
-    match result:
-        case Ok(value):
-            assert value == 52  # (21 * 2) + 10
-        case Err():
-            raise AssertionError("Should succeed")
-
-    # Error propagates through map_ok chain
-    result = parse_int("not a number")
-    result = map_ok(result, lambda x: x * 2)
-    result = map_ok(result, lambda x: x + 10)
-
-    match result:
-        case Err(error):
-            assert "Invalid integer" in error
-        case Ok():
-            raise AssertionError("Should fail")
-
-
-def test_collect_then_transform() -> None:
-    """collect can be combined with other operations."""
-    results = [Ok(1), Ok(2), Ok(3)]
-    collected = collect(results)
 
-    # Transform collected list
-    final = map_ok(collected, lambda values: sum(values))
+def test_map_ok_transforms_collected_list() -> None:
+    """map_ok can transform a collected list in one step."""
+    final = map_ok(Ok([1, 2, 3]), sum)
 
-    match final:
-        case Ok(total):
-            assert total == 6
-        case Err():
-            raise AssertionError("Should succeed")
+    assert_ok(final, 6)
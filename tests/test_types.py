@@ -3,34 +3,55 @@
 Basic instantiation, pattern matching, and type assertions for Result and Option.
 """
 
-from vicepython_core import Err, Nothing, Ok, Option, Result, Some
+import pytest
 
+from tests._common import Err, Nothing, Ok, Option, Result, Some
 
-def test_ok_instantiation() -> None:
-    """Ok can be instantiated with a value."""
-    result: Result[int, str] = Ok(42)
-    assert result.value == 42
-    assert result.kind == "ok"
 
+@pytest.mark.parametrize(
+    ("obj", "attr", "expected", "kind"),
+    [
+        (Ok(42), "value", 42, "ok"),
+        (Err("something went wrong"), "error", "something went wrong", "err"),
+        (Some(42), "value", 42, "some"),
+        (Nothing(), None, None, "nothing"),
+    ],
+)
+def test_instantiation(
+    obj: Ok[int] | Err[str] | Some[int] | Nothing, attr: str | None, expected: object, kind: str
+) -> None:
+    """Each variant can be instantiated and exposes its payload and kind."""
+    if attr is not None:
+        assert getattr(obj, attr) == expected
+    assert obj.kind == kind
 
-def test_err_instantiation() -> None:
-    """Err can be instantiated with an error."""
-    result: Result[int, str] = Err("something went wrong")
-    assert result.error == "something went wrong"
-    assert result.kind == "err"
 
+def test_kind_has_no_per_instance_storage() -> None:
+    """kind is a class-level constant, not a per-instance field."""
+    assert Ok.__slots__ == ("value",)
+    assert Err.__slots__ == ("error",)
+    assert Some.__slots__ == ("value",)
+    assert Nothing.__slots__ == ()
 
-def test_some_instantiation() -> None:
-    """Some can be instantiated with a value."""
-    opt: Option[int] = Some(42)
-    assert opt.value == 42
-    assert opt.kind == "some"
+    assert Ok.kind == "ok"
+    assert Err.kind == "err"
+    assert Some.kind == "some"
+    assert Nothing.kind == "nothing"
 
 
-def test_nothing_instantiation() -> None:
-    """Nothing can be instantiated."""
-    opt: Option[int] = Nothing()
-    assert opt.kind == "nothing"
+def test_match_args_are_explicit_minimal_tuples() -> None:
+    """__match_args__ are class-body constants covering only the payload."""
+    assert Ok.__match_args__ == ("value",)
+    assert Err.__match_args__ == ("error",)
+    assert Some.__match_args__ == ("value",)
+    assert Nothing.__match_args__ == ()
+
+
+def test_equality_ignores_kind() -> None:
+    """Equality and hashing are driven by the payload alone."""
+    assert Ok(42) == Ok(42)
+    assert Ok(42) != Err(42)
+    assert hash(Ok(42)) == hash(Ok(42))
 
 
 def test_result_pattern_matching_ok() -> None:
@@ -97,41 +118,27 @@ def test_option_with_different_types() -> None:
     assert isinstance(opt_nothing, Nothing)
 
 
-def test_frozen_ok() -> None:
-    """Ok instances are frozen (immutable)."""
-    result = Ok(42)
-    try:
-        result.value = 100  # type: ignore[misc]
-        raise AssertionError("Should not be able to modify frozen dataclass")
-    except AttributeError:
-        pass
-
-
-def test_frozen_err() -> None:
-    """Err instances are frozen (immutable)."""
-    result = Err("error")
-    try:
-        result.error = "new error"  # type: ignore[misc]
-        raise AssertionError("Should not be able to modify frozen dataclass")
-    except AttributeError:
-        pass
-
-
-def test_frozen_some() -> None:
-    """Some instances are frozen (immutable)."""
-    opt = Some(42)
-    try:
-        opt.value = 100  # type: ignore[misc]
-        raise AssertionError("Should not be able to modify frozen dataclass")
-    except AttributeError:
-        pass
-
-
-def test_frozen_nothing() -> None:
-    """Nothing instances are frozen (immutable)."""
-    opt = Nothing()
-    try:
-        opt.kind = "something"  # type: ignore[misc]
-        raise AssertionError("Should not be able to modify frozen dataclass")
-    except AttributeError:
-        pass
+@pytest.mark.parametrize(
+    ("obj", "attr", "val"),
+    [
+        (Ok(42), "value", 100),
+        (Err("error"), "error", "new error"),
+        (Some(42), "value", 100),
+    ],
+)
+def test_frozen_instances(obj: object, attr: str, val: object) -> None:
+    """ADT instances are frozen (immutable)."""
+    with pytest.raises(AttributeError):
+        setattr(obj, attr, val)
+
+
+def test_nothing_rejects_attribute_assignment() -> None:
+    """Nothing carries no storage and rejects any attribute assignment.
+
+    kind is a class-level constant, not a field, so this normally fails with
+    AttributeError from the empty __slots__; early 3.12 patch releases raise
+    TypeError instead, from a CPython bug in the __setattr__ generated for
+    frozen slots dataclasses.
+    """
+    with pytest.raises((AttributeError, TypeError)):
+        Nothing().kind = "something"  # type: ignore[misc]